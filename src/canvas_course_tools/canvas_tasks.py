@@ -1,7 +1,18 @@
+import atexit
+import functools
+import threading
+import time
+
 import canvasapi
-import httpx
 from canvasapi import Canvas
-from canvasapi.exceptions import Forbidden, InvalidAccessToken, ResourceDoesNotExist
+from canvasapi.exceptions import (
+    Forbidden,
+    InvalidAccessToken,
+    RateLimitExceeded,
+    ResourceDoesNotExist,
+)
+from canvasapi.requester import Requester
+from canvasapi.util import get_institution_url
 
 from canvas_course_tools.datatypes import (
     Assignment,
@@ -14,6 +25,13 @@ from canvas_course_tools.datatypes import (
     Student,
 )
 
+SUBMISSION_PARAMS = {"include[]": ["submission_history", "submission_comments"]}
+
+# throttled requests are retried this many times, waiting RATE_LIMIT_BACKOFF
+# seconds before the first retry and doubling the wait after every retry
+RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF = 1.0
+
 
 class CanvasObjectExistsError(Exception):
     pass
@@ -31,7 +49,27 @@ class CanvasTasks:
         """
         self.canvas = Canvas(url, token)
         self._url = url
-        self._headers = {"Authorization": f"Bearer {token}"}
+        self._token = token
+        self._local = threading.local()
+        self._courses = {}
+
+    @functools.cached_property
+    def client(self):
+        """Persistent httpx client for direct Canvas API requests.
+
+        The client reuses connections between requests. It is only created
+        when it is first used, since most commands never need it, and it is
+        closed when the program exits.
+        """
+        # httpx is slow to import, only load it when the client is needed
+        import httpx
+
+        client = httpx.Client(
+            base_url=self._url,
+            headers={"Authorization": f"Bearer {self._token.strip()}"},
+        )
+        atexit.register(client.close)
+        return client
 
     def list_courses(self):
         """List Canvas courses.
@@ -51,26 +89,47 @@ class CanvasTasks:
         Returns:
             A Canvas course object.
         """
-        course = self.canvas.get_course(course_id, include=["term"])
+        course = self._get_canvas_course(course_id)
         return create_course_object(course)
 
-    def get_students(self, course_id, show_test_student=False):
+    def _get_canvas_course(self, course_id):
+        """Get a canvasapi course by id, only requesting it once.
+
+        Args:
+            course_id: a Canvas course id.
+
+        Returns:
+            canvasapi.course.Course: the canvasapi course object.
+        """
+        course = self._courses.get(course_id)
+        if course is None:
+            course = self.canvas.get_course(course_id, include=["term"])
+            self._courses[course_id] = course
+        return course
+
+    def get_students(self, course_id, show_test_student=False, search_term=None):
         """Get all students in a course.
 
         Args:
             course_id (integer): the Canvas course id
             show_test_student (bool): if True, include the Test Student
+            search_term (str): if given, only get students matching this
+                search term (at least two characters). Canvas matches the term
+                against names, login ids and SIS ids.
 
         Returns:
-            list: a list of student objects
+            iterator: the student objects, fetched page by page while iterating
         """
-        course = self.canvas.get_course(course_id)
+        course = self._get_canvas_course(course_id)
         if show_test_student:
             enrollment_type = ["student", "student_view"]
         else:
             enrollment_type = ["student"]
-        students = course.get_users(enrollment_type=enrollment_type)
-        return [create_student_object(student) for student in students]
+        params = {"enrollment_type": enrollment_type}
+        if search_term is not None:
+            params["search_term"] = search_term
+        students = course.get_users(**params)
+        return (create_student_object(student) for student in students)
 
     def get_sections(self, course_id):
         """Get a list of sections, including students
@@ -81,7 +140,7 @@ class CanvasTasks:
         Returns:
             List[Section]: A list of Sections
         """
-        course = self.canvas.get_course(course_id)
+        course = self._get_canvas_course(course_id)
         sections = course.get_sections(include=["students"])
         return [
             Section(
@@ -111,7 +170,7 @@ class CanvasTasks:
         Returns:
             GroupSet: the newly created groupset
         """
-        canvas_course = self.canvas.get_course(course.id)
+        canvas_course = self._get_canvas_course(course.id)
         groupsets = list(canvas_course.get_group_categories())
         groupset_names = [g.name for g in groupsets]
         if name in groupset_names:
@@ -154,6 +213,9 @@ class CanvasTasks:
     def create_group(self, group_name, group_set):
         """Create a group inside a GroupSet.
 
+        This method can safely be called from multiple threads. Requests
+        throttled by Canvas are retried with exponential backoff.
+
         Args:
             group_name (str): name of the group to create.
             group_set (GroupSet): the GroupSet in which the group will be
@@ -161,10 +223,15 @@ class CanvasTasks:
 
         Returns:
             Group: the newly created group.
+
+        Raises:
+            RateLimitExceeded: if Canvas keeps throttling the request.
         """
-        groupset = self.canvas.get_group_category(group_set.id)
-        group = groupset.create_group(name=group_name)
-        return Group(id=group.id, name=group_name)
+        groupset = canvasapi.group.GroupCategory(
+            self._get_requester(), {"id": group_set.id}
+        )
+        group = retry_throttled(groupset.create_group, name=group_name)
+        return Group(id=group.id, name=group_name, _group=group)
 
     def list_groups(self, group_set: GroupSet) -> list[Group]:
         groups = group_set._group_set.get_groups()
@@ -173,12 +240,34 @@ class CanvasTasks:
     def add_student_to_group(self, student, group):
         """Add student to a group.
 
+        This method can safely be called from multiple threads. Requests
+        throttled by Canvas are retried with exponential backoff.
+
         Args:
             student (Student): the student to add to the group.
             group (Group): the group in which to place the student.
+
+        Raises:
+            RateLimitExceeded: if Canvas keeps throttling the request.
         """
-        canvas_group = self.canvas.get_group(group.id)
-        canvas_group.create_membership(student.id)
+        canvas_group = canvasapi.group.Group(self._get_requester(), {"id": group.id})
+        retry_throttled(canvas_group.create_membership, student.id)
+
+    def _get_requester(self):
+        """Get a canvasapi requester for the current thread.
+
+        Each thread gets its own requester, and with it its own HTTP session,
+        since requests sessions are not documented to be thread-safe.
+
+        Returns:
+            canvasapi.requester.Requester: the requester for this thread.
+        """
+        requester = getattr(self._local, "requester", None)
+        if requester is None:
+            # strip the token like canvasapi.Canvas does
+            requester = Requester(get_institution_url(self._url), self._token.strip())
+            self._local.requester = requester
+        return requester
 
     def get_students_in_group(self, group: Group) -> list[Student]:
         students = group._group.get_users()
@@ -221,12 +310,11 @@ class CanvasTasks:
         Returns:
             Submission: the student submission
         """
-        response = httpx.get(
-            f"{self._url}/api/v1/courses/{assignment.course.id}/assignments/{assignment.id}/submissions/{student.id}",
-            headers=self._headers,
-            params={"include[]": ["submission_history", "submission_comments"]},
+        response = self.client.get(
+            f"/api/v1/courses/{assignment.course.id}/assignments/{assignment.id}/submissions/{student.id}",
+            params=SUBMISSION_PARAMS,
         )
-        return CanvasSubmission.model_validate_json(response.text)
+        return CanvasSubmission.model_validate_json(response.content)
 
 
 def create_course_object(course: canvasapi.course.Course):
@@ -245,3 +333,44 @@ def create_student_object(student: canvasapi.user.User):
         name=student.short_name,
         sortable_name=student.sortable_name,
     )
+
+
+def retry_throttled(func, *args, **kwargs):
+    """Call a function, retrying requests which are throttled by Canvas.
+
+    Canvas throttles requests with either a 403 Forbidden (Rate Limit Exceeded)
+    or a 429 response. Throttled requests are retried with exponential backoff.
+
+    Args:
+        func: the function performing the request.
+        *args, **kwargs: arguments for the function.
+
+    Returns:
+        The return value of the function.
+
+    Raises:
+        RateLimitExceeded: if the request is still throttled after retrying.
+    """
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        try:
+            return func(*args, **kwargs)
+        except (Forbidden, RateLimitExceeded) as exc:
+            if not is_throttled(exc):
+                raise
+            if attempt == RATE_LIMIT_RETRIES:
+                raise RateLimitExceeded(str(exc)) from exc
+        time.sleep(RATE_LIMIT_BACKOFF * 2**attempt)
+
+
+def is_throttled(error):
+    """Check whether a Canvas error is caused by throttling.
+
+    Args:
+        error (CanvasException): the error raised by canvasapi.
+
+    Returns:
+        bool: True if Canvas throttled the request.
+    """
+    if isinstance(error, RateLimitExceeded):
+        return True
+    return "Rate Limit Exceeded" in str(error)
@@ -1,7 +1,14 @@
+import copy
+import functools
 import pathlib
 
+try:
+    import tomllib
+except ModuleNotFoundError:
+    # Python < 3.11
+    import tomli as tomllib
+
 import appdirs
-import tomli
 import tomli_w
 
 
@@ -10,13 +17,24 @@ CONFIG_FILE = "config.toml"
 
 
 def read_config():
-    """Read configuration file."""
+    """Read configuration file.
+
+    The file is only parsed once, but every caller gets its own copy of the
+    configuration which it is free to modify. Changes must be saved using
+    write_config().
+    """
+    return copy.deepcopy(parse_config_file())
+
+
+@functools.cache
+def parse_config_file():
+    """Parse the configuration file, caching the result."""
     config_path = get_config_path()
     if config_path.is_file():
         try:
             with open(config_path, "rb") as f:
-                return tomli.load(f)
-        except (tomli.TOMLDecodeError, UnicodeDecodeError):
+                return tomllib.load(f)
+        except (tomllib.TOMLDecodeError, UnicodeDecodeError):
             # error parsing TOML
             return {}
     else:
@@ -28,6 +46,7 @@ def write_config(config):
     Args:
         config: a dictionary containing the configuration.
     """
+    parse_config_file.cache_clear()
     create_config_dir()
     config_path = get_config_path()
     # make sure that TOML conversion works before opening file
@@ -39,6 +58,7 @@ def write_config(config):
         tomli_w.dump(config, f)
 
 
+@functools.cache
 def get_config_path():
     """Get path of configuration file."""
     config_dir = pathlib.Path(appdirs.user_config_dir(APP_NAME))
@@ -5,7 +5,7 @@ import canvasapi
 from pydantic import AliasChoices, AwareDatetime, BaseModel, Field, HttpUrl
 
 
-@dataclass
+@dataclass(slots=True)
 class Course:
     id: int
     name: str
@@ -15,21 +15,21 @@ class Course:
     _course: canvasapi.course.Course | None = field(default=None, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupSet:
     id: int
     name: str
     _group_set: canvasapi.group.GroupCategory | None = field(default=None, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     id: int
     name: str
     _group: canvasapi.group.Group | None = field(default=None, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Student:
     id: int
     name: str
@@ -42,37 +42,40 @@ class Student:
     def __post_init__(self):
         # Parse human names, allowing for underscores to group parts of the name
         self.first_name, _, self.last_name = self.name.partition(" ")
-        self.first_name = self.first_name.replace("_", " ")
-        self.name = self.name.replace("_", " ")
+        if "_" in self.name:
+            # replacing underscores keeps the length of the name intact, so
+            # the first name is simply the start of the normalized name
+            self.name = self.name.replace("_", " ")
+            self.first_name = self.name[: len(self.first_name)]
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     id: int
     name: str
     students: list[Student]
 
 
-@dataclass
+@dataclass(slots=True)
 class StudentGroup:
     name: str = ""
     students: list[Student] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupList:
     name: str = ""
     groups: list[StudentGroup] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignmentGroup:
     id: int
     name: str
     course: Course
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     id: int
     name: str
@@ -1,4 +1,3 @@
-import itertools
 import os.path
 import pathlib
 import re
@@ -8,35 +7,41 @@ from rich.console import Console
 
 from canvas_course_tools.datatypes import GroupList, Student, StudentGroup
 
-PARSE_STUDENT_RE = re.compile("(?P<name>.*) \((?P<id>.*)\) *(?:\[(?P<notes>.*)\])?")
+PARSE_STUDENT_RE = re.compile(r"(?P<name>.*) \((?P<id>.*)\) *(?:\[(?P<notes>.*)\])?")
 
 
-def parse_group_list(text, photo_dir=None, relative_to=None):
-    """Parse text and build a group list."""
+def parse_group_list(lines, photo_dir=None, relative_to=None):
+    """Parse lines of text and build a group list.
+
+    Args:
+        lines: the contents of a group list as a string, or an iterable of
+            lines, e.g. an open group list file.
+        photo_dir (pathlib.Path): search matching photos in this directory.
+        relative_to (pathlib.Path): make photo paths relative to this path.
+
+    Returns:
+        GroupList: the parsed group list.
+    """
     group_list = GroupList()
     current_group = StudentGroup()
+    match_student = PARSE_STUDENT_RE.match
+    if photo_dir:
+        photos = index_photos(photo_dir)
+    if isinstance(lines, str):
+        # iterating over a string would yield characters, not lines
+        lines = lines.splitlines()
 
-    for line in text.splitlines():
+    for line in lines:
+        line = line.rstrip("\n")
         if not line:
             # empty line
             continue
-        elif line.startswith("##"):
-            # new group name
-            group_name = line.removeprefix("##").strip()
-            if current_group.students:
-                # there are students in the current group, add them to the list
-                group_list.groups.append(current_group)
-            # create new group
-            current_group = StudentGroup(name=group_name)
-        elif line.startswith("#"):
-            # group list name
-            group_list.name = line.removeprefix("#").strip()
-        else:
+        elif line[0] != "#":
             # must be a student
-            match = PARSE_STUDENT_RE.match(line)
+            match = match_student(line)
             if match:
                 if photo_dir:
-                    photo = find_photo(match["name"], photo_dir)
+                    photo = find_photo(match["name"], photos)
                     if photo and relative_to is not None:
                         photo = pathlib.Path(os.path.relpath(photo, start=relative_to))
                 else:
@@ -49,24 +54,66 @@ def parse_group_list(text, photo_dir=None, relative_to=None):
                         photo=photo,
                     ),
                 )
+        elif line.startswith("##"):
+            # new group name
+            group_name = line.removeprefix("##").strip()
+            if current_group.students:
+                # there are students in the current group, add them to the list
+                group_list.groups.append(current_group)
+            # create new group
+            current_group = StudentGroup(name=group_name)
+        else:
+            # group list name
+            group_list.name = line.removeprefix("#").strip()
     group_list.groups.append(current_group)
 
     return group_list
 
 
-def find_photo(name, photo_dir):
+def index_photos(photo_dir):
+    """Index all photos in a directory by name.
+
+    Only files with an extension are considered photos. See
+    normalize_photo_name() for how names are matched.
+
+    Args:
+        photo_dir (pathlib.Path): Path to a directory with photos.
+
+    Returns:
+        dict: a mapping of normalized names (without extension) to paths.
+    """
+    photos = {}
+    for path in photo_dir.iterdir():
+        if path.is_file() and path.suffix:
+            photos.setdefault(normalize_photo_name(path.stem), path)
+    return photos
+
+
+def find_photo(name, photos):
     """Find a photo for a given student name.
 
     Args:
         name (str): Name of the student
-        photo_dir (pathlib.Path): Path to a directory with photos.
+        photos (dict): Index of photos, as returned by index_photos().
     """
-    try:
-        pattern = name + ".*"
-        nfc = unicodedata.normalize("NFC", pattern)
-        nfd = unicodedata.normalize("NFD", pattern)
-        return next(itertools.chain(photo_dir.glob(nfc), photo_dir.glob(nfd)))
-    except StopIteration:
+    photo = photos.get(normalize_photo_name(name))
+    if photo is None:
         console = Console(stderr=True)
         console.print(f"[red]WARNING: no photo found for {name}.")
-        return None
+    return photo
+
+
+def normalize_photo_name(name):
+    """Normalize a name for matching photos.
+
+    Names are normalized to NFC, since filesystems differ in how they store
+    accented characters. Case is only ignored on filesystems which are case
+    insensitive by default (Windows), like searching for the files would.
+
+    Args:
+        name (str): Name of the student or photo file (without extension).
+
+    Returns:
+        str: the normalized name.
+    """
+    return os.path.normcase(unicodedata.normalize("NFC", name))
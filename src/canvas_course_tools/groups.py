@@ -1,17 +1,20 @@
-import pathlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import rich_click as click
 from rich import print
-from rich.progress import Progress
 
 from canvas_course_tools.canvas_tasks import (
     CanvasObjectExistsError,
     Forbidden,
+    RateLimitExceeded,
     ResourceDoesNotExist,
 )
 from canvas_course_tools.group_lists import parse_group_list
 from canvas_course_tools.utils import find_course
 
+# number of concurrent requests to the Canvas server
+MAX_WORKERS = 8
+
 
 @click.group()
 def groups():
@@ -60,10 +63,13 @@ def create_canvas_groups(course_alias, group_list, overwrite):
     Ignore the \b and \f characters in this docstring. They are to tell click to
     not wrap paragraphs (\b) and not display this note (\f).
     """
+    # rich.progress is slow to import, only load it when creating groups
+    from rich.progress import Progress
+
     canvas, course = find_course(course_alias)
 
-    file_contents = pathlib.Path(group_list).read_text(encoding="utf-8")
-    group_list = parse_group_list(file_contents)
+    with open(group_list, encoding="utf-8") as f:
+        group_list = parse_group_list(f)
 
     print(f"Creating GroupSet {group_list.name}...")
     try:
@@ -73,28 +79,70 @@ def create_canvas_groups(course_alias, group_list, overwrite):
             f"Canvas groupset '{group_list.name}' already exists. You can use --overwrite."
         )
 
-    with Progress() as progress:
+    with Progress() as progress, ThreadPoolExecutor(MAX_WORKERS) as executor:
         task_groups = progress.add_task(
             description="Creating groups...", total=len(group_list.groups)
         )
-        task_students = progress.add_task(description="Adding students to group...")
+        task_students = progress.add_task(
+            description="Adding students to groups...",
+            total=sum(len(group.students) for group in group_list.groups),
+        )
+
+        # create all groups at once and start adding students to a group as
+        # soon as it has been created
+        group_futures = {
+            executor.submit(canvas.create_group, group.name, groupset): group
+            for group in group_list.groups
+        }
+        student_futures = {}
+        throttled_students = []
+        try:
+            for future in as_completed(group_futures):
+                group = group_futures[future]
+                try:
+                    canvas_group = future.result()
+                except Exception:
+                    print(
+                        f"[bold red]ERROR: could not create {group.name}, remaining groups and students were not added."
+                    )
+                    raise
+                for student in group.students:
+                    student_future = executor.submit(
+                        canvas.add_student_to_group, student, canvas_group
+                    )
+                    student_futures[student_future] = student
+                progress.advance(task_groups)
+                print(f"Created {group.name}.")
 
-        for group in group_list.groups:
-            canvas_group = canvas.create_group(group.name, groupset)
-            progress.reset(task_students, total=len(group.students))
-            for student in group.students:
+            for future in as_completed(student_futures):
+                student = student_futures[future]
                 try:
-                    canvas.add_student_to_group(student, canvas_group)
+                    future.result()
                 except ResourceDoesNotExist:
                     print(f"[red]WARNING: student {student.name} does not exist.")
+                except RateLimitExceeded:
+                    # must come before Forbidden, which it subclasses in canvasapi
+                    throttled_students.append(student)
+                    print(
+                        f"[red]WARNING: Canvas kept throttling requests, student {student.name} was not added."
+                    )
                 except Forbidden:
                     print(
                         f"[red]WARNING: you do not have authorization to add student {student.name}."
                     )
                 progress.advance(task_students)
-            progress.advance(task_groups)
-            print(f"Created {group.name}.")
-
+        except BaseException:
+            # stop making changes on Canvas on any unexpected error or Ctrl-C,
+            # like creating groups and adding students one by one would have
+            # done, instead of waiting for all queued requests to finish
+            executor.shutdown(cancel_futures=True)
+            raise
+
+    if throttled_students:
+        names = ", ".join(student.name for student in throttled_students)
+        raise click.ClickException(
+            f"Canvas rate limit exceeded, these students were not added to their group: {names}"
+        )
     print("Done")
 
 
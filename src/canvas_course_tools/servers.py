@@ -15,11 +15,8 @@ def servers():
 def show_servers():
     """List the registered servers."""
     config = configfile.read_config()
-    try:
-        servers = config["servers"]
-    except KeyError:
-        pass
-    else:
+    servers = config.get("servers")
+    if servers is not None:
         table = Table(box=box.HORIZONTALS)
         table.add_column("Alias")
         table.add_column("URL")
@@ -1,3 +1,6 @@
+import sys
+from operator import attrgetter
+
 import rich_click as click
 
 from canvas_course_tools import configfile
@@ -25,16 +28,15 @@ def list_students(course_alias, all):
     canvas, course = find_course(course_alias)
     print(f"# {course.name}\n")
     if all:
-        students = canvas.get_students(course.id)
-        students.sort(key=lambda x: x.sortable_name)
-        for student in students:
-            print(f"{student.name} ({student.id})")
+        students = sorted(
+            canvas.get_students(course.id), key=attrgetter("sortable_name")
+        )
+        print_students(students)
     else:
         for section in canvas.get_sections(course.id):
             print(f"## {section.name}\n")
-            section.students.sort(key=lambda x: x.sortable_name)
-            for student in section.students:
-                print(f"{student.name} ({student.id})")
+            section.students.sort(key=attrgetter("sortable_name"))
+            print_students(section.students)
             print("\n")
 
 
@@ -56,7 +58,17 @@ def list_students_from_group_set(server_alias, group_set_id: int) -> None:
     for group in canvas.list_groups(group_set):
         print(f"## {group.name}\n")
         students = canvas.get_students_in_group(group)
-        students.sort(key=lambda x: x.sortable_name)
-        for student in students:
-            print(f"{student.name} ({student.id})")
+        students.sort(key=attrgetter("sortable_name"))
+        print_students(students)
         print("\n")
+
+
+def print_students(students):
+    """Print a list of students, one student per line.
+
+    Args:
+        students (list): list of students
+    """
+    sys.stdout.write(
+        "".join(f"{student.name} ({student.id})\n" for student in students)
+    )
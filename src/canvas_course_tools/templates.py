@@ -1,12 +1,16 @@
+import functools
 import importlib.resources
 import pathlib
 
-import jinja2
+try:
+    import tomllib
+except ModuleNotFoundError:
+    # Python < 3.11
+    import tomli as tomllib
+
 import rich_click as click
-import tomli
 from rich import box
 from rich.console import Console
-from rich.syntax import Syntax
 from rich.table import Table
 
 from canvas_course_tools.datatypes import GroupList
@@ -26,7 +30,8 @@ def list_templates():
     """List all available templates."""
     template_files = importlib.resources.files("canvas_course_tools") / "templates"
     info_file = template_files / TEMPLATE_INFO_FILE
-    info = tomli.loads(info_file.read_text(encoding="utf-8"))
+    with info_file.open("rb") as f:
+        info = tomllib.load(f)
 
     table = Table(box=box.HORIZONTALS)
     table.add_column("Template")
@@ -54,6 +59,9 @@ def show_template(template):
     if not path.is_file():
         raise click.BadArgumentUsage(f"Template {template} not found!")
     elif console.is_terminal:
+        # importing rich.syntax loads pygments, so only do so when needed
+        from rich.syntax import Syntax
+
         syntax = Syntax.from_path(path)
         console.print()
         console.print(syntax)
@@ -130,23 +138,22 @@ def render(template, group_list, file, auto_write, output_dir, photo_dir):
     Ignore the \b and \f characters in this docstring. They are to tell click to
     not wrap paragraphs (\b) and not display this note (\f).
     """
-    file_contents = pathlib.Path(group_list).read_text(encoding="utf-8")
-
     if file or auto_write:
         output_path = build_output_path(file, output_dir, template, group_list)
         relative_to = output_path.parent
     else:
         relative_to = None
 
-    group_list_data = parse_group_list(
-        file_contents, photo_dir, relative_to=relative_to
-    )
+    with open(group_list, encoding="utf-8") as f:
+        group_list_data = parse_group_list(f, photo_dir, relative_to=relative_to)
     contents = render_template(template, group_list_data)
 
     if not file and not auto_write:
         # output to console
         console = Console()
         if console.is_terminal:
+            from rich.syntax import Syntax
+
             filetype = pathlib.Path(template).suffix.lstrip(".")
             syntax = Syntax(contents, lexer=filetype)
             console.print()
@@ -188,9 +195,9 @@ def build_output_path(file, output_dir, template, group_list):
         path = output_dir / file
     else:
         template_path = pathlib.Path(template)
-        filename = template_path.stem + "-" + pathlib.Path(group_list).stem
-        filepath = pathlib.Path(filename).with_suffix(template_path.suffix)
-        path = output_dir / filepath
+        group_list_stem = pathlib.Path(group_list).stem
+        filename = f"{template_path.stem}-{group_list_stem}{template_path.suffix}"
+        path = output_dir / filename
     return path
 
 
@@ -202,14 +209,35 @@ def render_template(template_name, group_list: GroupList):
             file.
         group_list (GroupList): the group list as input for the template
     """
-    if pathlib.Path(template_name).is_file():
-        env = jinja2.Environment(loader=jinja2.FileSystemLoader("."))
-    else:
-        env = jinja2.Environment(
-            loader=jinja2.PackageLoader("canvas_course_tools", "templates"),
-        )
+    # jinja2 is only needed when rendering, keep it out of CLI startup
+    import jinja2
+
+    env = get_environment(from_file=pathlib.Path(template_name).is_file())
     try:
         template = env.get_template(template_name, globals={"zip": zip})
     except jinja2.exceptions.TemplateNotFound:
         raise click.BadArgumentUsage(f"Template {template_name} not found!")
     return template.render(title=group_list.name, groups=group_list.groups)
+
+
+@functools.cache
+def get_environment(from_file):
+    """Get a Jinja2 environment for loading templates.
+
+    The environment is created only once, so that compiled templates are cached
+    between renders.
+
+    Args:
+        from_file (bool): if True, load templates from paths relative to the
+            current directory. Else, load templates included with the app.
+
+    Returns:
+        jinja2.Environment: the environment for loading templates.
+    """
+    import jinja2
+
+    if from_file:
+        loader = jinja2.FileSystemLoader(".")
+    else:
+        loader = jinja2.PackageLoader("canvas_course_tools", "templates")
+    return jinja2.Environment(loader=loader)
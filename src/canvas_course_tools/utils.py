@@ -1,3 +1,5 @@
+import functools
+
 import click
 
 from canvas_course_tools import configfile
@@ -6,21 +8,28 @@ from canvas_course_tools.canvas_tasks import CanvasTasks, Course
 
 def get_canvas(server_alias):
     config = configfile.read_config()
-    try:
-        server = config["servers"][server_alias]
-    except KeyError:
+    server = config.get("servers", {}).get(server_alias)
+    if server is None:
         raise click.UsageError(f"Unknown server '{server_alias}'.")
-    else:
-        return CanvasTasks(server["url"], server["token"])
+    return create_canvas(server["url"], server["token"])
+
+
+@functools.cache
+def create_canvas(url, token):
+    """Create a CanvasTasks instance, only once per server URL and token.
+
+    Caching on the URL and token instead of the server alias makes sure that a
+    changed server configuration is never served from the cache.
+    """
+    return CanvasTasks(url, token)
 
 
 def find_course(course_alias: str) -> tuple[CanvasTasks, Course]:
     config = configfile.read_config()
-    try:
-        server, course_id = (
-            config["courses"][course_alias][k] for k in ("server", "course_id")
-        )
-    except KeyError:
+    course_config = config.get("courses", {}).get(course_alias, {})
+    server = course_config.get("server")
+    course_id = course_config.get("course_id")
+    if server is None or course_id is None:
         raise click.BadArgumentUsage(f"Unknown course {course_alias}.")
     canvas = get_canvas(server)
     course = canvas.get_course(course_id)
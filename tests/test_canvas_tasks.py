@@ -0,0 +1,84 @@
+import subprocess
+import sys
+
+import pytest
+
+from canvas_course_tools import canvas_tasks
+from canvas_course_tools.canvas_tasks import (
+    Forbidden,
+    RateLimitExceeded,
+    retry_throttled,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(canvas_tasks, "RATE_LIMIT_BACKOFF", 0)
+
+
+def make_request(*errors):
+    """Create a fake request raising the given errors before succeeding."""
+    errors = list(errors)
+    calls = []
+
+    def request(*args, **kwargs):
+        calls.append((args, kwargs))
+        if errors:
+            raise errors.pop(0)
+        return "response"
+
+    return request, calls
+
+
+def test_retry_throttled_retries_throttled_requests():
+    request, calls = make_request(
+        Forbidden("403 Forbidden (Rate Limit Exceeded)"),
+        RateLimitExceeded("Rate Limit Exceeded"),
+    )
+    assert retry_throttled(request, 1, name="A") == "response"
+    assert calls == 3 * [((1,), {"name": "A"})]
+
+
+def test_retry_throttled_does_not_retry_other_errors():
+    request, calls = make_request(Forbidden("user not authorized"))
+    with pytest.raises(Forbidden):
+        retry_throttled(request)
+    assert len(calls) == 1
+
+
+def test_retry_throttled_gives_up():
+    throttled = Forbidden("403 Forbidden (Rate Limit Exceeded)")
+    request, calls = make_request(
+        *(canvas_tasks.RATE_LIMIT_RETRIES + 1) * [throttled]
+    )
+    with pytest.raises(RateLimitExceeded):
+        retry_throttled(request)
+    assert len(calls) == canvas_tasks.RATE_LIMIT_RETRIES + 1
+
+
+def test_client_is_created_lazily(monkeypatch):
+    exit_handlers = []
+    monkeypatch.setattr(canvas_tasks.atexit, "register", exit_handlers.append)
+    canvas = canvas_tasks.CanvasTasks("https://canvas.example.com", " token\n")
+    assert "client" not in vars(canvas)
+    client = canvas.client
+    assert canvas.client is client
+    assert client.headers["Authorization"] == "Bearer token"
+    assert exit_handlers == [client.close]
+
+
+def test_requester_uses_stripped_token():
+    canvas = canvas_tasks.CanvasTasks("https://canvas.example.com", " token\n")
+    assert canvas._get_requester().access_token == "token"
+
+
+def test_import_does_not_load_slow_modules():
+    # httpx imports rich.progress and rich.syntax when rich is installed
+    code = (
+        "import sys, canvas_course_tools.canvas_tasks, canvas_course_tools.groups;"
+        "print(sorted({'httpx', 'rich.progress', 'rich.syntax'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,23 @@
+import pytest
+
+from canvas_course_tools import configfile
+
+
+@pytest.fixture(autouse=True)
+def config_path(monkeypatch, tmp_path):
+    path = tmp_path / "config.toml"
+    monkeypatch.setattr(configfile, "get_config_path", lambda: path)
+    configfile.parse_config_file.cache_clear()
+    yield path
+    configfile.parse_config_file.cache_clear()
+
+
+def test_read_config_returns_a_copy():
+    configfile.write_config({"servers": {"canvas": {"url": "a", "token": "b"}}})
+    config = configfile.read_config()
+    config.setdefault("courses", {})["physics"] = {}
+    del config["servers"]["canvas"]
+    assert configfile.read_config() == {
+        "servers": {"canvas": {"url": "a", "token": "b"}}
+    }
+
@@ -0,0 +1,88 @@
+import unicodedata
+
+import pytest
+
+from canvas_course_tools.group_lists import (
+    PARSE_STUDENT_RE,
+    find_photo,
+    index_photos,
+    parse_group_list,
+)
+
+GROUP_LIST = """\
+# Physics 101
+## Group A
+Drew Ferrell (800057) [second year]
+Amanda James (379044)
+
+## Group B
+Elizabeth Allison (312702)
+"""
+
+
+@pytest.mark.parametrize(
+    "line, name, id, notes",
+    [
+        ("Drew Ferrell (800057)", "Drew Ferrell", "800057", None),
+        (
+            "Drew Ferrell (800057) [second year]",
+            "Drew Ferrell",
+            "800057",
+            "second year",
+        ),
+        ("Jan (Johnny) Jansen (123) [x]", "Jan (Johnny) Jansen", "123", "x"),
+        ("X (12) [a [b] c]", "X", "12", "a [b] c"),
+        ("A B (1)  [n] trailing", "A B", "1", "n"),
+        ("A ((1))", "A", "(1)", None),
+    ],
+)
+def test_parse_student_re(line, name, id, notes):
+    match = PARSE_STUDENT_RE.match(line)
+    assert match.group("name", "id", "notes") == (name, id, notes)
+
+
+def test_parse_student_re_without_id():
+    assert PARSE_STUDENT_RE.match("Drew Ferrell") is None
+
+
+def check_group_list(group_list):
+    assert group_list.name == "Physics 101"
+    assert [group.name for group in group_list.groups] == ["Group A", "Group B"]
+    students = group_list.groups[0].students
+    assert [student.name for student in students] == ["Drew Ferrell", "Amanda James"]
+    assert students[0].id == "800057"
+    assert students[0].notes == "second year"
+    assert students[1].notes is None
+
+
+def test_parse_group_list_from_file(tmp_path):
+    path = tmp_path / "groups.txt"
+    path.write_text(GROUP_LIST, encoding="utf-8")
+    with open(path, encoding="utf-8") as f:
+        check_group_list(parse_group_list(f))
+
+
+def test_parse_group_list_from_string():
+    check_group_list(parse_group_list(GROUP_LIST))
+
+
+def test_find_photo(tmp_path):
+    photo = tmp_path / "Drew Ferrell.jpg"
+    photo.touch()
+    photos = index_photos(tmp_path)
+    assert find_photo("Drew Ferrell", photos) == photo
+    assert find_photo("Amanda James", photos) is None
+
+
+def test_find_photo_nfd_filename(tmp_path):
+    photo = tmp_path / unicodedata.normalize("NFD", "Zoë Ågren.png")
+    photo.touch()
+    photos = index_photos(tmp_path)
+    assert find_photo(unicodedata.normalize("NFC", "Zoë Ågren"), photos) == photo
+
+
+def test_index_photos_skips_directories_and_files_without_extension(tmp_path):
+    (tmp_path / "Drew Ferrell").mkdir()
+    (tmp_path / "Amanda James").touch()
+    (tmp_path / "Antonio Morris.d").mkdir()
+    assert index_photos(tmp_path) == {}
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+from canvasapi.exceptions import CanvasException
+from click.testing import CliRunner
+
+from canvas_course_tools import groups
+from canvas_course_tools.canvas_tasks import RateLimitExceeded
+from canvas_course_tools.datatypes import Group, GroupSet
+
+GROUP_LIST = """\
+# Physics 101
+## Group A
+Drew Ferrell (800057)
+Amanda James (379044)
+
+## Group B
+Elizabeth Allison (312702)
+"""
+
+
+class FakeCanvas:
+    def __init__(
+        self, failing_group=None, throttled_student=None, failing_student=None
+    ):
+        self.failing_group = failing_group
+        self.throttled_student = throttled_student
+        self.failing_student = failing_student
+        self.created_groups = []
+        self.added_students = []
+
+    def create_groupset(self, name, course, overwrite):
+        return GroupSet(id=1, name=name)
+
+    def create_group(self, group_name, group_set):
+        self.created_groups.append(group_name)
+        if group_name == self.failing_group:
+            raise RuntimeError("Canvas error")
+        return Group(id=len(self.created_groups), name=group_name)
+
+    def add_student_to_group(self, student, group):
+        if student.name == self.throttled_student:
+            raise RateLimitExceeded("Rate Limit Exceeded")
+        if self.failing_student is not None:
+            if student.name == self.failing_student:
+                raise CanvasException("Canvas error")
+            # give the command time to handle the error before the next request
+            time.sleep(0.1)
+        self.added_students.append((student.name, group.name))
+
+
+@pytest.fixture
+def group_list(tmp_path):
+    path = tmp_path / "groups.txt"
+    path.write_text(GROUP_LIST, encoding="utf-8")
+    return str(path)
+
+
+def create_groups(monkeypatch, canvas, group_list):
+    monkeypatch.setattr(groups, "find_course", lambda alias: (canvas, None))
+    return CliRunner().invoke(groups.groups, ["create", "course", group_list])
+
+
+def test_create_canvas_groups(monkeypatch, group_list):
+    canvas = FakeCanvas()
+    result = create_groups(monkeypatch, canvas, group_list)
+    assert result.exit_code == 0
+    assert sorted(canvas.added_students) == [
+        ("Amanda James", "Group A"),
+        ("Drew Ferrell", "Group A"),
+        ("Elizabeth Allison", "Group B"),
+    ]
+
+
+def test_create_canvas_groups_stops_on_failing_group(monkeypatch, group_list):
+    monkeypatch.setattr(groups, "MAX_WORKERS", 1)
+    canvas = FakeCanvas(failing_group="Group A")
+    result = create_groups(monkeypatch, canvas, group_list)
+    assert isinstance(result.exception, RuntimeError)
+    assert canvas.created_groups == ["Group A"]
+    assert canvas.added_students == []
+
+
+def test_create_canvas_groups_stops_on_failing_student(monkeypatch, group_list):
+    monkeypatch.setattr(groups, "MAX_WORKERS", 1)
+    canvas = FakeCanvas(failing_student="Drew Ferrell")
+    result = create_groups(monkeypatch, canvas, group_list)
+    assert isinstance(result.exception, CanvasException)
+    # the request which was already running finishes, the rest is cancelled
+    assert canvas.added_students == [("Amanda James", "Group A")]
+
+
+def test_create_canvas_groups_fails_on_throttled_students(monkeypatch, group_list):
+    canvas = FakeCanvas(throttled_student="Amanda James")
+    result = create_groups(monkeypatch, canvas, group_list)
+    assert result.exit_code == 1
+    assert "Amanda James" in result.output
+    assert len(canvas.added_students) == 2
@@ -0,0 +1,15 @@
+from pathlib import Path
+
+from canvas_course_tools.templates import build_output_path
+
+
+def test_build_output_path_keeps_dots_in_group_list_name():
+    assert build_output_path(
+        None, Path("out"), "student-list.txt", "groups.v2.txt"
+    ) == Path("out/student-list-groups.v2.txt")
+
+
+def test_build_output_path_with_file():
+    assert build_output_path("list.txt", "out", "student-list.txt", "groups.txt") == (
+        Path("out/list.txt")
+    )
@@ -0,0 +1,33 @@
+import click
+import pytest
+
+from canvas_course_tools import configfile, utils
+
+
+@pytest.fixture(autouse=True)
+def config_path(monkeypatch, tmp_path):
+    path = tmp_path / "config.toml"
+    monkeypatch.setattr(configfile, "get_config_path", lambda: path)
+    configfile.parse_config_file.cache_clear()
+    utils.create_canvas.cache_clear()
+    yield path
+    configfile.parse_config_file.cache_clear()
+    utils.create_canvas.cache_clear()
+
+
+def test_get_canvas_uses_changed_server():
+    url = "https://canvas.example.com"
+    configfile.write_config({"servers": {"canvas": {"url": url, "token": "old"}}})
+    canvas = utils.get_canvas("canvas")
+    assert utils.get_canvas("canvas") is canvas
+
+    configfile.write_config({"servers": {"canvas": {"url": url, "token": "new"}}})
+    assert utils.get_canvas("canvas")._token == "new"
+
+
+@pytest.mark.parametrize("course", [{}, {"server": "canvas"}, {"course_id": 1234}, None])
+def test_find_course_with_incomplete_course(course):
+    courses = {} if course is None else {"physics": course}
+    configfile.write_config({"courses": courses})
+    with pytest.raises(click.BadArgumentUsage):
+        utils.find_course("physics")